@@ -21,8 +21,8 @@ import argparse
 import os
 import re
 import sys
-from datetime import datetime, timedelta
-from typing import Tuple, Optional, Dict
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
 
 import pandas as pd
 import xlrd
@@ -30,12 +30,19 @@ from xlwt import Workbook, XFStyle
 from xlutils.copy import copy as xlutils_copy
 
 
+# Timestamp format used by Microsoft Forms exports (MM/DD/YY HH:MM:SS)
+FORMS_DATETIME_FORMAT = '%m/%d/%y %H:%M:%S'
+
+# Valid --start_time values (24-hour HH:MM)
+_TIME_RE = re.compile(r'^([0-1]?[0-9]|2[0-3]):[0-5][0-9]$')
+
+
 def parse_arguments() -> argparse.Namespace:
     """
     Parse command-line arguments.
     
     Returns:
-        argparse.Namespace: Parsed arguments containing start_time and duration
+        argparse.Namespace: Parsed arguments containing start_time, duration and verbose
         
     Raises:
         SystemExit: If arguments are invalid or missing
@@ -63,10 +70,16 @@ Examples:
         help='Class duration in minutes (e.g., 180)'
     )
     
+    parser.add_argument(
+        '-v', '--verbose',
+        action='store_true',
+        help='Print a line for every updated student and every skipped submission'
+    )
+    
     args = parser.parse_args()
     
     # Validate start_time format
-    if not re.match(r'^([0-1]?[0-9]|2[0-3]):[0-5][0-9]$', args.start_time):
+    if not _TIME_RE.match(args.start_time):
         parser.error(f'Invalid start_time format: {args.start_time}. Expected HH:MM (e.g., 13:00)')
     
     # Validate duration
@@ -76,162 +89,188 @@ Examples:
     return args
 
 
-def extract_student_id(email: str) -> Optional[str]:
+def extract_student_ids(emails: pd.Series) -> pd.Series:
     """
-    Extract numeric student ID from email address.
+    Extract numeric student IDs from a column of email addresses.
     
     Removes the 'S' prefix (case-insensitive) and everything after '@'.
+    The work is done with pandas vectorized string methods rather than a
+    per-row Python function.
     
     Args:
-        email (str): Email in format S[ID]@rmit.edu.vn
+        emails (pd.Series): Emails in format S[ID]@rmit.edu.vn
         
     Returns:
-        Optional[str]: Numeric student ID, or None if extraction fails
+        pd.Series: Numeric student IDs as strings, or <NA> where extraction fails
         
     Examples:
-        >>> extract_student_id('S4186054@rmit.edu.vn')
-        '4186054'
-        >>> extract_student_id('s3992383@rmit.edu.vn')
-        '3992383'
-        >>> extract_student_id('4019025@rmit.edu.vn')
-        '4019025'
+        >>> extract_student_ids(pd.Series(['S4186054@rmit.edu.vn',
+        ...                                's3992383@rmit.edu.vn',
+        ...                                '4019025@rmit.edu.vn'])).tolist()
+        ['4186054', '3992383', '4019025']
     """
-    if pd.isna(email) or not isinstance(email, str):
-        return None
+    emails = emails.astype('string')
     
-    try:
-        # Extract part before '@'
-        email_prefix = email.split('@')[0].strip()
-        
-        # Remove 'S' or 's' prefix if present
-        if email_prefix.upper().startswith('S'):
-            student_id = email_prefix[1:]
-        else:
-            student_id = email_prefix
-        
-        # Verify it's numeric
-        if student_id.isdigit():
-            return student_id
-        else:
-            print(f"Warning: Non-numeric student ID extracted from email: {email}")
-            return None
-            
-    except Exception as e:
-        print(f"Error extracting student ID from email '{email}': {e}")
-        return None
+    # Students submit once per class, so parse each distinct email only once
+    unique_emails = pd.Series(emails.dropna().unique(), dtype='string')
+    
+    # Extract part before '@' and remove a single 'S' or 's' prefix if present
+    email_prefix = unique_emails.str.split('@').str[0].str.strip()
+    student_ids = email_prefix.str.replace(r'^[Ss]', '', regex=True)
+    
+    # Verify it's numeric
+    is_valid = student_ids.str.fullmatch(r'\d+', na=False)
+    for email in unique_emails[~is_valid]:
+        print(f"Warning: Non-numeric student ID extracted from email: {email}")
+    
+    id_by_email = pd.Series(student_ids.where(is_valid).array, index=unique_emails.array)
+    return emails.map(id_by_email).astype('string')
 
 
-def convert_date_format(date_obj: datetime) -> str:
+def parse_forms_datetimes(values: pd.Series) -> pd.Series:
     """
-    Convert datetime object to DD/MM format (without leading zeros).
+    Parse a Microsoft Forms timestamp column into datetime64 values.
+    
+    Excel usually stores these as real datetimes, in which case the column is
+    returned unchanged. Text timestamps are parsed with FORMS_DATETIME_FORMAT
+    instead of letting pandas infer the format value by value.
     
     Args:
-        date_obj (datetime): Datetime object containing the date
+        values (pd.Series): Timestamp column from the Forms export
         
     Returns:
-        str: Date in D/M format (e.g., '3/12' not '03/12')
+        pd.Series: Parsed datetimes, with NaT where a value could not be parsed
         
     Examples:
-        >>> convert_date_format(datetime(2024, 11, 26))
-        '26/11'
-        >>> convert_date_format(datetime(2024, 12, 3))
-        '3/12'
+        >>> parse_forms_datetimes(pd.Series(['12/03/24 08:15:30'])).tolist()
+        [Timestamp('2024-12-03 08:15:30')]
     """
-    # Use %-d and %-m on Unix/Mac, %#d and %#m on Windows
-    # But simpler: just format and remove leading zeros
-    day = date_obj.day
-    month = date_obj.month
-    return f'{day}/{month}'
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values
+    
+    return pd.to_datetime(values, format=FORMS_DATETIME_FORMAT, errors='coerce')
+
+
+def convert_date_formats(dates: pd.Series) -> pd.Series:
+    """
+    Convert a column of datetimes to DD/MM format (without leading zeros).
+    
+    Args:
+        dates (pd.Series): Column containing the dates
+        
+    Returns:
+        pd.Series: Dates in D/M format (e.g., '3/12' not '03/12'), or <NA>
+        where the value could not be parsed as a date
+        
+    Examples:
+        >>> convert_date_formats(pd.Series([datetime(2024, 11, 26),
+        ...                                 datetime(2024, 12, 3)])).tolist()
+        ['26/11', '3/12']
+    """
+    days = pd.to_datetime(dates, errors='coerce').dt.normalize()
+    
+    # Exports only span a handful of class dates, so format each distinct one once
+    unique_days = pd.Series(days.dropna().unique())
+    
+    # Go through nullable integers so that days/months are not rendered as '3.0'
+    day = unique_days.dt.day.astype('Int64').astype('string')
+    month = unique_days.dt.month.astype('Int64').astype('string')
+    
+    label_by_day = pd.Series((day + '/' + month).array, index=unique_days.array)
+    return days.map(label_by_day).astype('string')
 
 
 def calculate_attendance(
-    completion_time: datetime,
+    completion_times: pd.Series,
     start_time_str: str,
     duration_minutes: int
-) -> Tuple[str, int]:
+) -> Tuple[pd.Series, pd.Series]:
     """
-    Calculate attendance code and minutes based on completion time.
+    Calculate attendance codes and minutes based on completion times.
+    
+    All submissions are processed in a single vectorized pass.
     
     Args:
-        completion_time (datetime): When the student completed the attendance form
+        completion_times (pd.Series): When each student completed the attendance form
         start_time_str (str): Class start time in HH:MM format
         duration_minutes (int): Class duration in minutes
         
     Returns:
-        Tuple[str, int]: Attendance code ('Y' or 'N') and minutes present
+        Tuple[pd.Series, pd.Series]: Attendance codes ('Y' or 'N') and minutes present
         
     Examples:
         Class starts at 13:00, duration 180 minutes (ends at 16:00)
-        >>> calculate_attendance(datetime(2024, 11, 26, 13, 0), '13:00', 180)
-        ('Y', 180)
-        >>> calculate_attendance(datetime(2024, 11, 26, 13, 15), '13:00', 180)
-        ('Y', 165)
-        >>> calculate_attendance(datetime(2024, 11, 26, 16, 30), '13:00', 180)
-        ('N', 0)
+        >>> codes, minutes = calculate_attendance(
+        ...     pd.Series([datetime(2024, 11, 26, 13, 0),
+        ...                datetime(2024, 11, 26, 13, 15),
+        ...                datetime(2024, 11, 26, 16, 30)]), '13:00', 180)
+        >>> list(zip(codes, minutes))
+        [('Y', 180), ('Y', 165), ('N', 0)]
     """
+    completion_times = pd.to_datetime(completion_times, errors='coerce')
+    
     # Parse start time
     start_hour, start_minute = map(int, start_time_str.split(':'))
     
-    # Create class start datetime using the completion date
-    class_start = completion_time.replace(
-        hour=start_hour,
-        minute=start_minute,
-        second=0,
-        microsecond=0
-    )
-    
-    # Calculate class end time
-    class_end = class_start + timedelta(minutes=duration_minutes)
+    # Create class start datetimes using the completion dates
+    start_offset = pd.Timedelta(hours=start_hour, minutes=start_minute)
+    class_start = completion_times.dt.normalize() + start_offset
     
-    # If student arrived before class started, they're present for full duration
-    if completion_time <= class_start:
-        return 'Y', duration_minutes
+    # Calculate class end times
+    class_end = class_start + pd.Timedelta(minutes=duration_minutes)
     
-    # If student arrived after class ended, they're absent
-    if completion_time >= class_end:
-        return 'N', 0
+    # Students who arrived before class started are present for the full duration;
+    # those who arrived during class get the remaining (whole) minutes. Lateness is
+    # floor-divided on the int64 nanosecond values so no float conversion is needed
+    elapsed_ns = (completion_times - class_start).to_numpy(dtype='int64', na_value=0)
+    minutes_late = pd.Series(
+        elapsed_ns // pd.Timedelta(minutes=1).value,
+        index=completion_times.index
+    ).clip(lower=0)
     
-    # Student arrived during class - calculate remaining minutes
-    minutes_late = (completion_time - class_start).total_seconds() / 60
-    minutes_present = duration_minutes - int(minutes_late)
+    # Students who arrived after class ended are absent
+    arrived_in_time = completion_times < class_end
+    codes = pd.Series('Y', index=completion_times.index).where(arrived_in_time, 'N')
+    minutes = (duration_minutes - minutes_late).where(arrived_in_time, 0)
     
-    return 'Y', minutes_present
+    return codes, minutes
 
 
-def find_forms_file() -> Optional[str]:
+def find_input_files() -> Tuple[Optional[str], Optional[str]]:
     """
-    Find the Microsoft Forms file (.xlsx) in the current directory.
+    Find the Microsoft Forms file (.xlsx) and the attendance template file (.xls)
+    in the current directory, using a single directory scan.
     
     Returns:
-        Optional[str]: Filename of the .xlsx file, or None if not found
+        Tuple[Optional[str], Optional[str]]: Filenames of the .xlsx and .xls files,
+        each None if not found
     """
-    xlsx_files = [f for f in os.listdir('.') if f.endswith('.xlsx')]
-    
+    xlsx_files = []
+    xls_files = []
+    with os.scandir('.') as entries:
+        for entry in entries:
+            if entry.name.endswith('.xlsx'):
+                xlsx_files.append(entry.name)
+            elif entry.name.endswith('.xls'):
+                xls_files.append(entry.name)
+    
+    forms_file = None
     if len(xlsx_files) == 0:
         print("Error: No .xlsx file found in the current directory")
-        return None
-    elif len(xlsx_files) > 1:
-        print(f"Warning: Multiple .xlsx files found. Using: {xlsx_files[0]}")
-    
-    return xlsx_files[0]
-
-
-def find_template_file() -> Optional[str]:
-    """
-    Find the attendance template file (.xls) in the current directory.
-    
-    Returns:
-        Optional[str]: Filename of the .xls file, or None if not found
-    """
-    xls_files = [f for f in os.listdir('.') if f.endswith('.xls') and not f.endswith('.xlsx')]
+    else:
+        if len(xlsx_files) > 1:
+            print(f"Warning: Multiple .xlsx files found. Using: {xlsx_files[0]}")
+        forms_file = xlsx_files[0]
     
+    template_file = None
     if len(xls_files) == 0:
         print("Error: No .xls file found in the current directory")
-        return None
-    elif len(xls_files) > 1:
-        print(f"Warning: Multiple .xls files found. Using: {xls_files[0]}")
+    else:
+        if len(xls_files) > 1:
+            print(f"Warning: Multiple .xls files found. Using: {xls_files[0]}")
+        template_file = xls_files[0]
     
-    return xls_files[0]
+    return forms_file, template_file
 
 
 def read_forms_data(filename: str) -> pd.DataFrame:
@@ -251,20 +290,34 @@ def read_forms_data(filename: str) -> pd.DataFrame:
     print(f"\nReading Microsoft Forms file: {filename}")
     
     try:
-        df = pd.read_excel(filename)
+        # Only load the columns we use; openpyxl opens the workbook read-only
+        df = pd.read_excel(
+            filename,
+            engine='openpyxl',
+            usecols=['Email', 'Start time', 'Completion time'],
+            dtype={'Email': 'string'}
+        )
         print(f"  Loaded {len(df)} records")
         
+        # Parse timestamps using the known Forms format
+        df['Start time'] = parse_forms_datetimes(df['Start time'])
+        df['Completion time'] = parse_forms_datetimes(df['Completion time'])
+        
         # Extract student IDs from Email column
-        df['student_id'] = df['Email'].apply(extract_student_id)
+        df['student_id'] = extract_student_ids(df['Email'])
         
         # Convert start time to date format DD/MM
-        df['date'] = df['Start time'].apply(convert_date_format)
+        # (categorical: an export only spans a few class dates)
+        df['date'] = convert_date_formats(df['Start time']).astype('category')
         
         # Keep only necessary columns
         result = df[['student_id', 'date', 'Completion time']].copy()
         
-        # Remove records with missing student IDs
-        result = result.dropna(subset=['student_id'])
+        # Remove records with missing student IDs or unreadable completion times
+        result = result.dropna(subset=['student_id', 'Completion time'])
+        
+        # Student IDs are all digits at this point, so store them as integers
+        result['student_id'] = result['student_id'].astype('int64')
         
         print(f"  Extracted {len(result)} valid student records")
         
@@ -287,39 +340,59 @@ def read_template_file(filename: str) -> Tuple[pd.DataFrame, Dict]:
         
     Returns:
         Tuple[pd.DataFrame, Dict]: 
-            - DataFrame with the raw template data
+            - DataFrame with the student ID column and the attendance columns,
+              indexed by sheet row and column numbers
             - Dictionary mapping dates to column indices
             
     The template has a multi-level header:
     - Row 3: Dates (DD/MM format)
     - Row 4: Sub-headers (Code, Minutes)
     - Row 5+: Student data
+    
+    Only the cells the update needs are read, straight from the xlrd sheet,
+    rather than loading the whole sheet into pandas.
     """
     print(f"\nReading attendance template file: {filename}")
     
     try:
-        # Read without header to get raw structure
-        df = pd.read_excel(filename, header=None)
-        
-        # Extract date row (row index 3)
-        date_row = df.iloc[3]
-        
-        # Extract sub-header row (row index 4)
-        subheader_row = df.iloc[4]
-        
-        # Build date column mapping
-        date_columns = {}
-        for col_idx, date_val in enumerate(date_row):
-            if pd.notna(date_val) and isinstance(date_val, str) and '/' in date_val:
-                # This is a date column
-                # The Code column is at col_idx, Minutes at col_idx + 1
-                date_columns[date_val] = {
-                    'code_col': col_idx,
-                    'minutes_col': col_idx + 1
-                }
+        book = xlrd.open_workbook(filename, on_demand=True)
+        try:
+            sheet = book.sheet_by_index(0)
+            
+            # Extract date row (row index 3)
+            date_row = sheet.row_values(3)
+            
+            # Build date column mapping
+            date_columns = {}
+            for col_idx, date_val in enumerate(date_row):
+                if isinstance(date_val, str) and '/' in date_val:
+                    # This is a date column
+                    # The Code column is at col_idx, Minutes at col_idx + 1
+                    date_columns[date_val] = {
+                        'code_col': col_idx,
+                        'minutes_col': col_idx + 1
+                    }
+            
+            # Student IDs (column 0) and the Code/Minutes columns, from row 5 down
+            columns = [0]
+            for cols in date_columns.values():
+                columns.extend([cols['code_col'], cols['minutes_col']])
+            
+            student_rows = range(5, sheet.nrows)
+            df = pd.DataFrame(
+                {
+                    col_idx: sheet.col_values(col_idx, start_rowx=5)
+                    if col_idx < sheet.ncols else [''] * len(student_rows)
+                    for col_idx in columns
+                },
+                index=student_rows,
+                dtype=object
+            )
+        finally:
+            book.release_resources()
         
         print(f"  Found {len(date_columns)} date columns: {list(date_columns.keys())}")
-        print(f"  Template has {len(df) - 5} student records")
+        print(f"  Template has {len(df)} student records")
         
         return df, date_columns
         
@@ -336,64 +409,101 @@ def update_attendance_data(
     template_df: pd.DataFrame,
     date_columns: Dict,
     start_time: str,
-    duration: int
-) -> pd.DataFrame:
+    duration: int,
+    verbose: bool = False
+) -> List[Tuple[int, int, Any]]:
     """
     Update attendance template with data from Microsoft Forms.
     
     Args:
         forms_df (pd.DataFrame): Processed forms data
-        template_df (pd.DataFrame): Raw template data
+        template_df (pd.DataFrame): Template data from read_template_file, updated in place
         date_columns (Dict): Mapping of dates to column indices
         start_time (str): Class start time in HH:MM format
         duration (int): Class duration in minutes
+        verbose (bool): Print every update and skipped submission, not just totals
         
     Returns:
-        pd.DataFrame: Updated template dataframe
+        List[Tuple[int, int, Any]]: (row, column, value) for every cell that was
+        written, in write order
     """
     print("\nProcessing attendance data...")
     
-    updated_df = template_df.copy()
+    changes = []
     updates_count = 0
+    skipped_dates = []
+    missing_students = []
+    
+    # Calculate attendance for every submission at once
+    codes, minutes = calculate_attendance(forms_df['Completion time'], start_time, duration)
+    forms_df = forms_df.assign(code=codes, minutes=minutes)
     
     # Get all dates being processed from forms
     dates_in_forms = forms_df['date'].unique()
     
-    # Process each form submission
-    for _, form_row in forms_df.iterrows():
-        student_id = str(int(float(form_row['student_id'])))
-        date = form_row['date']
-        completion_time = form_row['Completion time']
+    # Index template students by integer ID once (template_df is labelled by
+    # sheet row/column); if an ID appears more than once, the first row wins
+    template_ids = pd.to_numeric(template_df[0], errors='coerce').dropna().astype('int64')
+    template_ids = template_ids[~template_ids.duplicated()]
+    template_students = pd.DataFrame({
+        'student_id': template_ids.to_numpy(),
+        'template_row': template_ids.index.to_numpy()
+    })
+    
+    # Join submissions to template rows; template_row is NaN for unknown students
+    forms_df = forms_df.merge(template_students, on='student_id', how='left')
+    
+    # Process form submissions one date at a time so that each date's
+    # code and minutes columns are written in a single assignment. The dates
+    # are handled sequentially on purpose: DataFrame assignment is not
+    # thread-safe, and writes into object columns hold the GIL anyway
+    for date, date_rows in forms_df.groupby('date', sort=False, observed=True, dropna=False):
+        student_ids = date_rows['student_id'].tolist()
         
         # Check if this date exists in the template
         if date not in date_columns:
-            print(f"  Warning: Date {date} not found in template for student {student_id}")
+            skipped_dates.append(date)
+            if verbose:
+                for student_id in student_ids:
+                    print(f"  Warning: Date {date} not found in template for student {student_id}")
             continue
         
-        # Find the student in the template (student IDs start at row 5, column 0)
-        student_found = False
-        for row_idx in range(5, len(updated_df)):
-            template_student_id = str(int(updated_df.iloc[row_idx, 0])) if pd.notna(updated_df.iloc[row_idx, 0]) else None
-            
-            if template_student_id == student_id:
-                student_found = True
-                
-                # Calculate attendance
-                code, minutes = calculate_attendance(completion_time, start_time, duration)
-                
-                # Update the template
-                code_col = date_columns[date]['code_col']
-                minutes_col = date_columns[date]['minutes_col']
-                
-                updated_df.iloc[row_idx, code_col] = code
-                updated_df.iloc[row_idx, minutes_col] = minutes
-                
-                updates_count += 1
-                print(f"  Updated student {student_id} for {date}: Code={code}, Minutes={minutes}")
-                break
-        
-        if not student_found:
-            print(f"  Warning: Student {student_id} not found in template")
+        found = date_rows['template_row'].notna()
+        missing_students.extend(date_rows.loc[~found, 'student_id'].tolist())
+        
+        if verbose:
+            for student_id, is_found, code, mins in zip(
+                student_ids, found, date_rows['code'], date_rows['minutes']
+            ):
+                if is_found:
+                    print(f"  Updated student {student_id} for {date}: Code={code}, Minutes={mins}")
+                else:
+                    print(f"  Warning: Student {student_id} not found in template")
+        
+        matched = date_rows[found]
+        row_idxs = matched['template_row'].astype('int64').tolist()
+        codes = matched['code'].tolist()
+        minutes = matched['minutes'].tolist()
+        
+        # Update the template (for repeated submissions the last one wins)
+        code_col = date_columns[date]['code_col']
+        minutes_col = date_columns[date]['minutes_col']
+        
+        template_df.loc[row_idxs, code_col] = codes
+        template_df.loc[row_idxs, minutes_col] = minutes
+        
+        for row_idx, code, mins in zip(row_idxs, codes, minutes):
+            changes.append((row_idx, code_col, code))
+            changes.append((row_idx, minutes_col, mins))
+        
+        updates_count += len(row_idxs)
+    
+    if skipped_dates:
+        print(f"  Warning: Dates not found in template: {', '.join(map(str, skipped_dates))}")
+    if missing_students:
+        unique_missing = sorted(set(missing_students))
+        print(f"  Warning: {len(unique_missing)} students not found in template: "
+              f"{', '.join(map(str, unique_missing))}")
     
     print(f"\nTotal updates made: {updates_count}")
     
@@ -408,30 +518,36 @@ def update_attendance_data(
         code_col = date_columns[date]['code_col']
         minutes_col = date_columns[date]['minutes_col']
         
-        # Check each student in the template
-        for row_idx in range(5, len(updated_df)):
-            current_code = updated_df.iloc[row_idx, code_col]
-            
-            # If the code is still '--' (default value), student is absent
-            if current_code == '--':
-                updated_df.iloc[row_idx, code_col] = 'N'
-                updated_df.iloc[row_idx, minutes_col] = 0
-                
-                student_id = updated_df.iloc[row_idx, 0]
-                print(f"  Marked student {student_id} as absent for {date}: Code=N, Minutes=0")
-                absent_count += 1
+        # If the code is still '--' (default value), student is absent
+        codes = template_df[code_col]
+        absent_rows = codes.index[codes == '--']
+        
+        template_df.loc[absent_rows, code_col] = 'N'
+        template_df.loc[absent_rows, minutes_col] = 0
+        
+        for row_idx in absent_rows.tolist():
+            changes.append((row_idx, code_col, 'N'))
+            changes.append((row_idx, minutes_col, 0))
+        
+        print(f"  Marked {len(absent_rows)} students as absent for {date}: Code=N, Minutes=0")
+        absent_count += len(absent_rows)
     
     print(f"\nTotal absent students marked: {absent_count}")
-    return updated_df
+    return changes
 
 
-def save_updated_template(df: pd.DataFrame, original_filename: str) -> str:
+def save_updated_template(changes: List[Tuple[int, int, Any]], original_filename: str) -> str:
     """
     Save the updated template as a new .xls file with '_updated' suffix,
     preserving the original formatting using xlutils.copy.
     
+    myTimetable only downloads and imports legacy .xls (BIFF) workbooks, which
+    openpyxl cannot read or write, so the xlrd/xlutils/xlwt stack is kept here.
+    Only the cells listed in changes are written on top of the copy.
+    
     Args:
-        df (pd.DataFrame): Updated template dataframe
+        changes (List[Tuple[int, int, Any]]): (row, column, value) cells to write,
+            as returned by update_attendance_data
         original_filename (str): Original template filename
         
     Returns:
@@ -446,7 +562,6 @@ def save_updated_template(df: pd.DataFrame, original_filename: str) -> str:
     try:
         # Open the original file with xlrd to preserve formatting
         rb = xlrd.open_workbook(original_filename, formatting_info=True)
-        rs = rb.sheet_by_index(0)
         
         # Copy the workbook to preserve all formatting
         wb = xlutils_copy(rb)
@@ -454,36 +569,12 @@ def save_updated_template(df: pd.DataFrame, original_filename: str) -> str:
         # Get the first sheet for writing
         ws = wb.get_sheet(0)
         
-        # Only write cells that have been updated (not NaN and different from original)
-        for row_idx in range(len(df)):
-            for col_idx in range(len(df.columns)):
-                updated_value = df.iloc[row_idx, col_idx]
-                
-                # Skip if the value is NaN (not updated)
-                if pd.isna(updated_value):
-                    continue
-                
-                # Get original value to check if it changed
-                if row_idx < rs.nrows and col_idx < rs.ncols:
-                    original_value = rs.cell(row_idx, col_idx).value
-                    
-                    # Convert both to strings for comparison (handles type differences)
-                    # IMPORTANT: Handle 0 and False explicitly
-                    orig_str = str(original_value) if original_value is not None and original_value != '' else ""
-                    updated_str = str(updated_value) if updated_value is not None and updated_value != '' else ""
-                    
-                    # Only write if the value actually changed
-                    if orig_str != updated_str:
-                        if isinstance(updated_value, (int, float)):
-                            ws.write(row_idx, col_idx, updated_value)
-                        else:
-                            ws.write(row_idx, col_idx, str(updated_value))
-                else:
-                    # New cell (beyond original file), write it
-                    if isinstance(updated_value, (int, float)):
-                        ws.write(row_idx, col_idx, updated_value)
-                    else:
-                        ws.write(row_idx, col_idx, str(updated_value))
+        # Only write the cells that were updated
+        for row_idx, col_idx, updated_value in changes:
+            if isinstance(updated_value, (int, float)):
+                ws.write(row_idx, col_idx, updated_value)
+            else:
+                ws.write(row_idx, col_idx, str(updated_value))
         
         # Save the workbook
         wb.save(output_filename)
@@ -513,8 +604,7 @@ def main():
     
     try:
         # Find input files
-        forms_file = find_forms_file()
-        template_file = find_template_file()
+        forms_file, template_file = find_input_files()
         
         if not forms_file or not template_file:
             print("\nError: Required files not found")
@@ -527,16 +617,17 @@ def main():
         template_df, date_columns = read_template_file(template_file)
         
         # Update attendance data
-        updated_df = update_attendance_data(
+        changes = update_attendance_data(
             forms_df,
             template_df,
             date_columns,
             args.start_time,
-            args.duration
+            args.duration,
+            args.verbose
         )
         
         # Save updated template
-        output_file = save_updated_template(updated_df, template_file)
+        output_file = save_updated_template(changes, template_file)
         
         print("\n" + "=" * 80)
         print("PROCESS COMPLETED SUCCESSFULLY")